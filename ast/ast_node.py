@@ -3,19 +3,25 @@ Node classes for RPAL Language AST
 Defines the structure and behavior of nodes in the AST.
 """
 
+import sys
+
 class Node:
     """Base class for nodes in the AST."""
-    def __init__(self):
-        # Core node properties
-        self.data = None                # The actual data stored in this node (e.g., operator or value)
-        self.depth = 0                  # Depth level in the AST (distance from root)
-        self.parent = None              # Reference to parent node for tree navigation
-        self.children = []              # List of child nodes forming the tree structure
-        self.is_standardized = False    # Flag indicating whether standardization has been applied
+    # Fixed attribute layout: no per-instance __dict__ for the many nodes in a tree
+    __slots__ = ("data", "depth", "parent", "children", "is_standardized")
+
+    def __init__(self, data=None, depth=0, parent=None, children=None, is_standardized=False):
+        # Core node properties, all settable at construction so factories need no setter calls
+        self.data = sys.intern(data) if isinstance(data, str) else data  # Operator or value, interned like set_data
+        self.depth = depth                      # Depth level in the AST (distance from root)
+        self.parent = parent                    # Reference to parent node for tree navigation
+        self.children = children if children is not None else []  # List of child nodes forming the tree structure
+        self.is_standardized = is_standardized  # Flag indicating whether standardization has been applied
 
     def set_data(self, data):
         """Set the data content of the node."""
-        self.data = data
+        # Labels such as "<ID:x>" repeat throughout a tree; intern them so they share one object
+        self.data = sys.intern(data) if isinstance(data, str) else data
 
     def get_data(self):
         """Get the data content of the node."""
@@ -51,264 +57,271 @@ class Node:
         This process transforms high-level language constructs into a uniform
         functional representation suitable for evaluation.
         """
-        # Only standardize if not already done (prevents infinite recursion)
-        if not self.is_standardized:
-            # First, recursively standardize all children from bottom-up
-            for child in self.children:
-                child.standardize()
-
-            # Apply transformation rules based on node type
-            if self.data == "let":
-                # Transform: let x = E in P  →  gamma(lambda x.P, E)
-                # This converts let-expressions into function application
-                #       LET              GAMMA
-                #     /     \           /     \
-                #    EQUAL   P   ->   LAMBDA   E
-                #   /   \             /    \
-                #  X     E           X      P 
-                
-                # Extract E from the equal node and move it up
-                temp1 = self.children[0].children[1]  # E
-                temp1.set_parent(self)
-                temp1.set_depth(self.depth + 1)
-                
-                # Move P to become body of lambda
-                temp2 = self.children[1]  # P
-                temp2.set_parent(self.children[0])
-                temp2.set_depth(self.depth + 2)
-                
-                # Restructure the tree
-                self.children[1] = temp1
-                self.children[0].set_data("lambda")  # Convert EQUAL to LAMBDA
-                self.children[0].children[1] = temp2
-                self.set_data("gamma")  # Convert LET to GAMMA (function application)
-                
-            elif self.data == "where":
-                # Transform: P where x = E  →  let x = E in P
-                # This converts where-expressions to let-expressions for uniform handling
-                #       WHERE               LET
-                #       /   \             /     \
-                #      P    EQUAL   ->  EQUAL   P
-                #           /   \       /   \
-                #          X     E     X     E
-                
-                # Swap P and EQUAL positions
-                temp = self.children[0]
-                self.children[0] = self.children[1]
-                self.children[1] = temp
-                self.set_data("let")
-                self.standardize()  # Recursively apply let transformation
-                
-            elif self.data == "function_form":
-                # Transform: function definition with multiple parameters
-                # f v1 v2 ... vn = E  →  f = lambda v1.(lambda v2.(...(lambda vn.E)...))
-                # This creates nested lambda expressions for curried functions
-                #       FCN_FORM                EQUAL
-                #       /   |   \              /    \
-                #      P    V+   E    ->      P     +LAMBDA
-                #                                    /     \
-                #                                    V     .E
-                
-                Ex = self.children[-1]  # The expression E
-                # Create the first lambda node
-                current_lambda = NodeFactory.get_node_with_parent("lambda", self.depth + 1, self, [], True)
-                self.children.insert(1, current_lambda)
-
-                # Process each parameter, creating nested lambdas
-                i = 2
-                while self.children[i] != Ex:
-                    V = self.children[i]  # Current parameter
-                    self.children.pop(i)
-                    V.set_depth(current_lambda.depth + 1)
-                    V.set_parent(current_lambda)
-                    current_lambda.children.append(V)
-
-                    # Create another lambda if more parameters exist
-                    if len(self.children) > 3:
-                        current_lambda = NodeFactory.get_node_with_parent("lambda", current_lambda.depth + 1, current_lambda, [], True)
-                        current_lambda.get_parent().children.append(current_lambda)
-
-                # Attach the expression to the innermost lambda
-                current_lambda.children.append(Ex)
-                self.children.pop(2)
-                self.set_data("=")  # Convert to simple assignment
-                
-            elif self.data == "lambda":
-                # Transform: lambda with multiple parameters into nested lambdas
-                # lambda v1 v2 ... vn.E  →  lambda v1.(lambda v2.(...(lambda vn.E)...))
-                # This ensures all lambdas have exactly one parameter
-                #     LAMBDA        LAMBDA
-                #      /   \   ->   /    \
-                #     V++   E      V     .E
-                
-                if len(self.children) > 2:  # Multiple parameters
-                    Ey = self.children[-1]  # The body expression
-                    # Create nested lambda structure
-                    current_lambda = NodeFactory.get_node_with_parent("lambda", self.depth + 1, self, [], True)
-                    self.children.insert(1, current_lambda)
-
-                    # Process each parameter except the first
-                    i = 2
-                    while self.children[i] != Ey:
-                        V = self.children[i]
-                        self.children.pop(i)
-                        V.set_depth(current_lambda.depth + 1)
-                        V.set_parent(current_lambda)
-                        current_lambda.children.append(V)
-
-                        # Create deeper nesting if needed
-                        if len(self.children) > 3:
-                            current_lambda = NodeFactory.get_node_with_parent("lambda", current_lambda.depth + 1, current_lambda, [], True)
-                            current_lambda.get_parent().children.append(current_lambda)
-
-                    # Attach body to innermost lambda
-                    current_lambda.children.append(Ey)
-                    self.children.pop(2)
-                    
-            elif self.data == "within":
-                # Transform: within construct for nested bindings
-                # x1 = E1 within x2 = E2  →  x2 = gamma(lambda x1.E2, E1)
-                # This allows inner binding to reference outer binding
-                #           WITHIN                  EQUAL
-                #          /      \                /     \
-                #        EQUAL   EQUAL    ->      X2     GAMMA
-                #       /    \   /    \                  /    \
-                #      X1    E1 X2    E2               LAMBDA  E1
-                #                                      /    \
-                #                                     X1    E2
-                
-                # Extract components from both equal nodes
-                X1 = self.children[0].children[0]  # Variable from first binding
-                X2 = self.children[1].children[0]  # Variable from second binding
-                E1 = self.children[0].children[1]  # Expression from first binding
-                E2 = self.children[1].children[1]  # Expression from second binding
-                
-                # Create gamma and lambda nodes for the transformation
-                gamma = NodeFactory.get_node_with_parent("gamma", self.depth + 1, self, [], True)
-                lambda_ = NodeFactory.get_node_with_parent("lambda", self.depth + 2, gamma, [], True)
-                
-                # Adjust depths and parents for the restructured tree
-                X1.set_depth(X1.get_depth() + 1)
-                X1.set_parent(lambda_)
-                X2.set_depth(X1.get_depth() - 1)
-                X2.set_parent(self)
-                E1.set_depth(E1.get_depth())
-                E1.set_parent(gamma)
-                E2.set_depth(E2.get_depth() + 1)
-                E2.set_parent(lambda_)
-                
-                # Build the new tree structure
-                lambda_.children.append(X1)
-                lambda_.children.append(E2)
-                gamma.children.append(lambda_)
-                gamma.children.append(E1)
-                self.children.clear()
-                self.children.append(X2)
-                self.children.append(gamma)
-                self.set_data("=")
-                
-            elif self.data == "@":
-                # Transform: infix operator application
-                # E1 @ N E2  →  gamma(gamma(N, E1), E2)
-                # This converts infix notation to prefix function application
-                #         AT              GAMMA
-                #       / | \    ->       /    \
-                #      E1 N E2          GAMMA   E2
-                #                       /    \
-                #                      N     E1
-                
-                # Create nested gamma structure for curried application
-                gamma1 = NodeFactory.get_node_with_parent("gamma", self.depth + 1, self, [], True)
-                e1 = self.children[0]
-                e1.set_depth(e1.get_depth() + 1)
-                e1.set_parent(gamma1)
-                n = self.children[1]
-                n.set_depth(n.get_depth() + 1)
-                n.set_parent(gamma1)
-                
-                # Build inner gamma(N, E1)
-                gamma1.children.append(n)
-                gamma1.children.append(e1)
-                
-                # Remove processed children and restructure
-                self.children.pop(0)
-                self.children.pop(0)
-                self.children.insert(0, gamma1)
-                self.set_data("gamma")  # Outer gamma application
-                
-            elif self.data == "and":
-                # Transform: simultaneous definitions
-                # x1 = E1 and x2 = E2 and ...  →  (x1, x2, ...) = tau(E1, E2, ...)
-                # This handles mutually recursive definitions
-                #         SIMULTDEF            EQUAL
-                #             |               /     \
-                #           EQUAL++  ->     COMMA   TAU
-                #           /   \             |      |
-                #          X     E           X++    E++
-                
-                # Create comma (tuple) and tau (tuple constructor) nodes
-                comma = NodeFactory.get_node_with_parent(",", self.depth + 1, self, [], True)
-                tau = NodeFactory.get_node_with_parent("tau", self.depth + 1, self, [], True)
-
-                # Separate variables and expressions from all equal nodes
-                for equal in self.children:
-                    equal.children[0].set_parent(comma)    # Variable goes to comma
-                    equal.children[1].set_parent(tau)      # Expression goes to tau
-                    comma.children.append(equal.children[0])
-                    tau.children.append(equal.children[1])
-
-                # Replace children with comma and tau
-                self.children.clear()
-                self.children.append(comma)
-                self.children.append(tau)
-                self.set_data("=")
-                
-            elif self.data == "rec":
-                # Transform: recursive definition
-                # rec x = E  →  x = gamma(Y*, lambda x.E)
-                # This uses the Y combinator for recursion
-                #        REC                 EQUAL
-                #         |                 /     \
-                #       EQUAL     ->       X     GAMMA
-                #      /     \                   /    \
-                #     X       E                YSTAR  LAMBDA
-                #                                     /     \
-                #                                     X      E
-                
-                # Extract variable and expression from the recursive definition
-                X = self.children[0].children[0]  # Recursive variable
-                E = self.children[0].children[1]  # Recursive expression
-                
-                # Create a copy of X for the left side of assignment
-                F = NodeFactory.get_node_with_parent(X.get_data(), self.depth + 1, self, X.children, True)
-                
-                # Create gamma, Y*, and lambda nodes for fixed-point computation
-                G = NodeFactory.get_node_with_parent("gamma", self.depth + 1, self, [], True)
-                Y = NodeFactory.get_node_with_parent("<Y*>", self.depth + 2, G, [], True)  # Y combinator
-                L = NodeFactory.get_node_with_parent("lambda", self.depth + 2, G, [], True)
-
-                # Adjust depths and parents for lambda body
-                X.set_depth(L.depth + 1)
-                X.set_parent(L)
-                E.set_depth(L.depth + 1)
-                E.set_parent(L)
-                
-                # Build the lambda(X.E) structure
-                L.children.append(X)
-                L.children.append(E)
-                
-                # Build gamma(Y*, lambda(X.E))
-                G.children.append(Y)
-                G.children.append(L)
-                
-                # Create final assignment: X = gamma(Y*, lambda(X.E))
-                self.children.clear()
-                self.children.append(F)
-                self.children.append(G)
-                self.set_data("=")
-
-            # Mark this node as standardized to prevent re-processing
-            self.is_standardized = True
+        # Walk the subtree in post-order with an explicit stack instead of recursion,
+        # so deeply nested programs don't run into Python's recursion limit.
+        # Each entry is (node, whether its children have already been standardized).
+        stack = [(self, False)]
+        while stack:
+            node, children_done = stack.pop()
+            # Skip nodes (and their subtrees) that are already standardized
+            if node.is_standardized:
+                continue
+            if children_done:
+                node.apply_standardization_rule()
+                # Mark this node as standardized to prevent re-processing
+                node.is_standardized = True
+            else:
+                # Revisit this node once all of its children are standardized, bottom-up
+                stack.append((node, True))
+                for child in reversed(node.children):
+                    if child.children or child.data in _STANDARDIZATION_RULES:
+                        stack.append((child, False))
+                    else:
+                        child.is_standardized = True  # Leaf with no rule: nothing to rewrite, skip the round trip
+
+    def apply_standardization_rule(self):
+        """
+        Apply the standardization rule for this node's construct. The children
+        must already be standardized. Nodes without a rule are left unchanged.
+        """
+        rule = _STANDARDIZATION_RULES.get(self.data)  # One dict lookup instead of an if/elif chain
+        if rule is not None:
+            rule(self)
+
+    def standardize_let(self):
+        """Standardize a let node."""
+        # Transform: let x = E in P  →  gamma(lambda x.P, E)
+        # This converts let-expressions into function application
+        #       LET              GAMMA
+        #     /     \           /     \
+        #    EQUAL   P   ->   LAMBDA   E
+        #   /   \             /    \
+        #  X     E           X      P 
+
+        children = self.children
+        equal = children[0]
+
+        # Extract E from the equal node and move it up
+        temp1 = equal.children[1]  # E
+        temp1.parent = self
+        temp1.depth = self.depth + 1
+
+        # Move P to become body of lambda
+        temp2 = children[1]  # P
+        temp2.parent = equal
+        temp2.depth = self.depth + 2
+
+        # Restructure the tree
+        children[1] = temp1
+        equal.data = "lambda"  # Convert EQUAL to LAMBDA
+        equal.children[1] = temp2
+        self.data = "gamma"  # Convert LET to GAMMA (function application)
+
+    def standardize_where(self):
+        """Standardize a where node."""
+        # Transform: P where x = E  →  let x = E in P
+        # This converts where-expressions to let-expressions for uniform handling
+        #       WHERE               LET
+        #       /   \             /     \
+        #      P    EQUAL   ->  EQUAL   P
+        #           /   \       /   \
+        #          X     E     X     E
+
+        # Swap P and EQUAL positions
+        children = self.children
+        children[0], children[1] = children[1], children[0]
+        self.data = "let"
+        # The children are already standardized, so apply the let rule directly
+        self.standardize_let()
+
+    def standardize_function_form(self):
+        """Standardize a function_form node."""
+        # Transform: function definition with multiple parameters
+        # f v1 v2 ... vn = E  →  f = lambda v1.(lambda v2.(...(lambda vn.E)...))
+        # This creates nested lambda expressions for curried functions
+        #       FCN_FORM                EQUAL
+        #       /   |   \              /    \
+        #      P    V+   E    ->      P     +LAMBDA
+        #                                    /     \
+        #                                    V     .E
+
+        # Replace the parameters and E with a single chain of one-parameter lambdas
+        children = self.children
+        children[1:] = [self.build_curried_lambdas(children[1:-1], children[-1])]
+        self.data = "="  # Convert to simple assignment
+
+    def standardize_lambda(self):
+        """Standardize a lambda node."""
+        # Transform: lambda with multiple parameters into nested lambdas
+        # lambda v1 v2 ... vn.E  →  lambda v1.(lambda v2.(...(lambda vn.E)...))
+        # This ensures all lambdas have exactly one parameter
+        #     LAMBDA        LAMBDA
+        #      /   \   ->   /    \
+        #     V++   E      V     .E
+
+        children = self.children
+        if len(children) > 2:  # Multiple parameters
+            # Keep the first parameter here and nest the rest with the body below it
+            children[1:] = [self.build_curried_lambdas(children[1:-1], children[-1])]
+
+    def build_curried_lambdas(self, parameters, body):
+        """
+        Build lambda p1.(lambda p2.(...(lambda pn.body)...)) as a child chain of this node.
+        
+        Args:
+            parameters: The parameter nodes, outermost first
+            body: The body expression for the innermost lambda
+            
+        Returns:
+            Node: The outermost lambda, to be placed among this node's children
+        """
+        outermost = current_lambda = NodeFactory.get_node_with_parent("lambda", self.depth + 1, self, [], True)
+        last = len(parameters) - 1
+        for index, V in enumerate(parameters):  # Each parameter is visited once, no list shifting
+            V.depth = current_lambda.depth + 1
+            V.parent = current_lambda
+            current_lambda.children.append(V)
+
+            # Create another lambda if more parameters follow
+            if index < last:
+                inner_lambda = NodeFactory.get_node_with_parent("lambda", current_lambda.depth + 1, current_lambda, [], True)
+                current_lambda.children.append(inner_lambda)
+                current_lambda = inner_lambda
+
+        # Attach the body to the innermost lambda
+        current_lambda.children.append(body)
+        return outermost
+
+    def standardize_within(self):
+        """Standardize a within node."""
+        # Transform: within construct for nested bindings
+        # x1 = E1 within x2 = E2  →  x2 = gamma(lambda x1.E2, E1)
+        # This allows inner binding to reference outer binding
+        #           WITHIN                  EQUAL
+        #          /      \                /     \
+        #        EQUAL   EQUAL    ->      X2     GAMMA
+        #       /    \   /    \                  /    \
+        #      X1    E1 X2    E2               LAMBDA  E1
+        #                                      /    \
+        #                                     X1    E2
+
+        # Extract components from both equal nodes
+        children = self.children
+        X1, E1 = children[0].children  # Variable and expression from first binding
+        X2, E2 = children[1].children  # Variable and expression from second binding
+
+        # Create gamma and lambda nodes for the transformation
+        gamma = NodeFactory.get_node_with_parent("gamma", self.depth + 1, self, [], True)
+        lambda_ = NodeFactory.get_node_with_parent("lambda", self.depth + 2, gamma, [], True)
+
+        # Adjust depths and parents for the restructured tree
+        X2.depth = X1.depth
+        X2.parent = self
+        X1.depth += 1
+        X1.parent = lambda_
+        E1.parent = gamma
+        E2.depth += 1
+        E2.parent = lambda_
+
+        # Build the new tree structure
+        lambda_.children.extend((X1, E2))
+        gamma.children.extend((lambda_, E1))
+        children[:] = [X2, gamma]
+        self.data = "="
+
+    def standardize_at(self):
+        """Standardize an @ (infix application) node."""
+        # Transform: infix operator application
+        # E1 @ N E2  →  gamma(gamma(N, E1), E2)
+        # This converts infix notation to prefix function application
+        #         AT              GAMMA
+        #       / | \    ->       /    \
+        #      E1 N E2          GAMMA   E2
+        #                       /    \
+        #                      N     E1
+
+        # Create nested gamma structure for curried application
+        gamma1 = NodeFactory.get_node_with_parent("gamma", self.depth + 1, self, [], True)
+        children = self.children
+        e1 = children[0]
+        e1.depth += 1
+        e1.parent = gamma1
+        n = children[1]
+        n.depth += 1
+        n.parent = gamma1
+
+        # Build inner gamma(N, E1)
+        gamma1.children.extend((n, e1))
+
+        # Replace E1 and N with the inner gamma
+        children[0:2] = [gamma1]
+        self.data = "gamma"  # Outer gamma application
+
+    def standardize_and(self):
+        """Standardize an and (simultaneous definition) node."""
+        # Transform: simultaneous definitions
+        # x1 = E1 and x2 = E2 and ...  →  (x1, x2, ...) = tau(E1, E2, ...)
+        # This handles mutually recursive definitions
+        #         SIMULTDEF            EQUAL
+        #             |               /     \
+        #           EQUAL++  ->     COMMA   TAU
+        #           /   \             |      |
+        #          X     E           X++    E++
+
+        # Separate variables and expressions from all equal nodes in one pass each
+        variables = [equal.children[0] for equal in self.children]    # Variables go to comma
+        expressions = [equal.children[1] for equal in self.children]  # Expressions go to tau
+
+        # Create comma (tuple) and tau (tuple constructor) nodes around them
+        comma = NodeFactory.get_node_with_parent(",", self.depth + 1, self, variables, True)
+        tau = NodeFactory.get_node_with_parent("tau", self.depth + 1, self, expressions, True)
+        for variable in variables:
+            variable.parent = comma
+        for expression in expressions:
+            expression.parent = tau
+
+        # Replace children with comma and tau
+        self.children[:] = [comma, tau]
+        self.data = "="
+
+    def standardize_rec(self):
+        """Standardize a rec node."""
+        # Transform: recursive definition
+        # rec x = E  →  x = gamma(Y*, lambda x.E)
+        # This uses the Y combinator for recursion
+        #        REC                 EQUAL
+        #         |                 /     \
+        #       EQUAL     ->       X     GAMMA
+        #      /     \                   /    \
+        #     X       E                YSTAR  LAMBDA
+        #                                     /     \
+        #                                     X      E
+
+        # Extract variable and expression from the recursive definition
+        children = self.children
+        X, E = children[0].children  # Recursive variable and expression
+
+        # Create a copy of X for the left side of assignment
+        F = NodeFactory.get_node_with_parent(X.data, self.depth + 1, self, X.children, True)
+
+        # Create gamma, Y*, and lambda nodes for fixed-point computation
+        G = NodeFactory.get_node_with_parent("gamma", self.depth + 1, self, [], True)
+        Y = NodeFactory.get_node_with_parent("<Y*>", self.depth + 2, G, [], True)  # Y combinator
+        L = NodeFactory.get_node_with_parent("lambda", self.depth + 2, G, [], True)
+
+        # Adjust depths and parents for lambda body
+        X.depth = E.depth = L.depth + 1
+        X.parent = E.parent = L
+
+        # Build the lambda(X.E) structure
+        L.children.extend((X, E))
+
+        # Build gamma(Y*, lambda(X.E))
+        G.children.extend((Y, L))
+
+        # Create final assignment: X = gamma(Y*, lambda(X.E))
+        children[:] = [F, G]
+        self.data = "="
 
 class NodeFactory:
     """Factory class for creating nodes with different configurations."""
@@ -327,11 +340,7 @@ class NodeFactory:
         Returns:
             Node: A newly created node with empty children list
         """
-        node = Node()
-        node.set_data(data)
-        node.set_depth(depth)
-        node.children = []  # Initialize empty children list
-        return node
+        return Node(data, depth)  # Children list is initialized empty by Node()
 
     @staticmethod
     def get_node_with_parent(data, depth, parent, children, is_standardized):
@@ -348,10 +357,16 @@ class NodeFactory:
         Returns:
             Node: A fully configured node ready for use
         """
-        node = Node()
-        node.set_data(data)
-        node.set_depth(depth)
-        node.set_parent(parent)
-        node.children = children
-        node.is_standardized = is_standardized
-        return node
\ No newline at end of file
+        return Node(data, depth, parent, children, is_standardized)
+
+# Standardization rule for each construct, keyed by node data
+_STANDARDIZATION_RULES = {
+    "let": Node.standardize_let,
+    "where": Node.standardize_where,
+    "function_form": Node.standardize_function_form,
+    "lambda": Node.standardize_lambda,
+    "within": Node.standardize_within,
+    "@": Node.standardize_at,
+    "and": Node.standardize_and,
+    "rec": Node.standardize_rec,
+}
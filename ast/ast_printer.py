@@ -3,8 +3,17 @@ Abstract Syntax Tree (AST) for RPAL Language
 Represents the structure of an RPAL program.
 """
 
+import sys
 from ast.ast_node import Node, NodeFactory
 
+_DOTS = [""]  # _DOTS[d] is the indentation prefix for a node at depth d
+
+def _dots(depth):
+    """Return the cached dot prefix for the given depth, growing the cache on demand."""
+    while len(_DOTS) <= depth:
+        _DOTS.append(_DOTS[-1] + ".")
+    return _DOTS[depth]
+
 class AST:
     """Class representing an Abstract Syntax Tree."""
     def __init__(self, root=None):
@@ -32,11 +41,17 @@ class AST:
             node: The current node
             i: The current indentation level
         """
-        
+        lines = []  # Output lines, written out in one go at the end
+        stack = [(node, i)]  # Explicit stack of (node, depth) pairs still to visit
 
-        print("." * i + str(node.get_data())) # Print the current node's data with indentation
-        for child in node.children:
-            self.pre_order_traverse(child, i + 1) # Recursively traverse child nodes
+        while stack:
+            current, depth = stack.pop()
+            lines.append(_dots(depth) + str(current.data))  # Current node's data with indentation
+            # Push children in reverse so the leftmost child is visited first
+            for child in reversed(current.children):
+                stack.append((child, depth + 1))
+
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def print_ast(self):
         """Print the AST."""
@@ -58,33 +73,57 @@ class ASTFactory:
             AST: The created AST
         """
         root = NodeFactory.get_node(data[0], 0)  # Create the root node
-        previous_node = root  # Initialize the previous node as the root
-        current_depth = 0  # Initialize the current depth as 0
-
-        for s in data[1:]:
-            i = 0  # index of word
-            d = 0  # depth of node
+        ancestors = [root]  # ancestors[d] is the most recent node seen at depth d
 
-            # Count the number of leading dots to determine the depth
-            while s[i] == '.':
-                d += 1
-                i += 1
+        for index in range(1, len(data)):  # Walk the lines by index instead of copying data[1:]
+            s = data[index]
+            word = s.lstrip('.')  # The node's text after its leading dots
+            d = len(s) - len(word)  # depth of node: the number of leading dots
 
             # Create the current node using the remaining string (after dots)
-            current_node = NodeFactory.get_node(s[i:], d)  # Create the current node
-
-            if current_depth < d:
-                 # If we go deeper, current node is a child of previous node
-                previous_node.children.append(current_node)  # Add current node as a child of previous node
-                current_node.set_parent(previous_node)  
-            else:
-                 # If we stay at the same level or go up, move up to the correct parent
-                while previous_node.get_depth() != d:
-                    previous_node = previous_node.get_parent()  # Traverse up the tree until reaching the node at depth d
-                 # Add the current node as a sibling under the correct parent
-                previous_node.get_parent().children.append(current_node)  
-                current_node.set_parent(previous_node.get_parent())  
-
-            previous_node = current_node   # Update previous node
-            current_depth = d  # Update current depth
+            current_node = NodeFactory.get_node(word, d)  # Create the current node
+
+            # The parent is the latest open node one level up; close any deeper frames
+            parent = ancestors[d - 1]
+            del ancestors[d:]
+            parent.children.append(current_node)  # Add current node as a child of its parent
+            current_node.parent = parent
+            ancestors.append(current_node)  # Current node is now the open frame at depth d
+
+        return AST(root) # Return the constructed AST
+
+    def get_abstract_syntax_tree_from_nodes(self, nodes):
+        """
+        Create an AST directly from the parser's node list, without going
+        through the string representation.
+        
+        Args:
+            nodes: The parser's nodes in post-order, each with a label and a child count
+            
+        Returns:
+            AST: The created AST
+        """
+        stack = []  # Subtrees built so far whose parent has not been reached yet
+
+        for parser_node in nodes:
+            current_node = NodeFactory.get_node(parser_node.get_label(), 0)
+            count = parser_node.no_of_children
+            if count:
+                # A node's children are the last `count` subtrees completed before it
+                current_node.children = stack[-count:]
+                del stack[-count:]
+                for child in current_node.children:
+                    child.parent = current_node
+            stack.append(current_node)
+
+        root = stack.pop()  # The last node in post-order is the root
+
+        # Fill in depths top-down, matching what the string form would have produced
+        pending = [root]
+        while pending:
+            node = pending.pop()
+            for child in node.children:
+                child.depth = node.depth + 1
+                pending.append(child)
+
         return AST(root) # Return the constructed AST
\ No newline at end of file
@@ -5,6 +5,7 @@ Fixed CSE Machine for RPAL Language
 Properly handles built-in functions and partial application.
 """
 
+from collections import deque
 from utils.helper_functions import convert_string_to_bool
 
 class Symbol:
@@ -384,15 +385,15 @@ class CSEMachine:
             current_symbol = self.control.pop()
             
             if isinstance(current_symbol, Id):
-                self.stack.insert(0, current_environment.lookup(current_symbol))
+                self.stack.appendleft(current_environment.lookup(current_symbol))
             elif isinstance(current_symbol, Lambda):
                 current_symbol.set_environment(current_environment.get_index())
-                self.stack.insert(0, current_symbol)
+                self.stack.appendleft(current_symbol)
             elif isinstance(current_symbol, Gamma):
                 if len(self.stack) < 2:
                     raise RuntimeError("Stack underflow: not enough arguments for gamma")
                 
-                next_symbol = self.stack.pop(0)
+                next_symbol = self.stack.popleft()
                 
                 if isinstance(next_symbol, Lambda):
                     # Handle Lambda expression
@@ -400,10 +401,10 @@ class CSEMachine:
                     e = E(j)
                     j += 1
                     if len(lambda_expr.identifiers) == 1:
-                        temp = self.stack.pop(0)
+                        temp = self.stack.popleft()
                         e.values[lambda_expr.identifiers[0]] = temp
                     else:
-                        tup = self.stack.pop(0)
+                        tup = self.stack.popleft()
                         for i, id in enumerate(lambda_expr.identifiers):
                             e.values[id] = tup.symbols[i]
                     for env in self.environment:
@@ -412,48 +413,48 @@ class CSEMachine:
                     current_environment = e
                     self.control.append(e)
                     self.control.append(lambda_expr.get_delta())
-                    self.stack.insert(0, e)
+                    self.stack.appendleft(e)
                     self.environment.append(e)
                 elif isinstance(next_symbol, BuiltinFunction):
                     # Handle built-in function
-                    arg = self.stack.pop(0)
+                    arg = self.stack.popleft()
                     next_symbol.add_arg(arg)
                     
                     if next_symbol.is_fully_applied():
                         result = next_symbol.apply()
-                        self.stack.insert(0, result)
+                        self.stack.appendleft(result)
                     else:
                         # Return partially applied function
-                        self.stack.insert(0, next_symbol)
+                        self.stack.appendleft(next_symbol)
                 elif isinstance(next_symbol, Tup):
                     # Handle Tup expression
                     tup = next_symbol
-                    i = int(self.stack.pop(0).get_data())
-                    self.stack.insert(0, tup.symbols[i - 1])
+                    i = int(self.stack.popleft().get_data())
+                    self.stack.appendleft(tup.symbols[i - 1])
                 elif isinstance(next_symbol, Ystar):
                     # Handle Ystar expression
-                    lambda_expr = self.stack.pop(0)
+                    lambda_expr = self.stack.popleft()
                     eta = Eta()
                     eta.set_index(lambda_expr.get_index())
                     eta.set_environment(lambda_expr.get_environment())
                     eta.set_identifier(lambda_expr.identifiers[0])
                     eta.set_lambda(lambda_expr)
-                    self.stack.insert(0, eta)
+                    self.stack.appendleft(eta)
                 elif isinstance(next_symbol, Eta):
                     # Handle Eta expression
                     eta = next_symbol
                     lambda_expr = eta.get_lambda()
                     self.control.append(Gamma())
                     self.control.append(Gamma())
-                    self.stack.insert(0, eta)
-                    self.stack.insert(0, lambda_expr)
+                    self.stack.appendleft(eta)
+                    self.stack.appendleft(lambda_expr)
                 else:
                     raise RuntimeError(f"Cannot apply gamma to {type(next_symbol)}")
                     
             elif isinstance(current_symbol, E):
                 # Handle E expression
                 if len(self.stack) > 1:
-                    self.stack.pop(1)
+                    del self.stack[1]  # Drop the environment marker just below the result
                 self.environment[current_symbol.get_index()].set_is_removed(True)
                 y = len(self.environment)
                 while y > 0:
@@ -466,28 +467,28 @@ class CSEMachine:
                 if isinstance(current_symbol, Uop):
                     # Handle Unary operation
                     rator = current_symbol
-                    rand = self.stack.pop(0)
-                    self.stack.insert(0, self.apply_unary_operation(rator, rand))
+                    rand = self.stack.popleft()
+                    self.stack.appendleft(self.apply_unary_operation(rator, rand))
                 if isinstance(current_symbol, Bop):
                     # Handle Binary operation
                     rator = current_symbol
-                    rand1 = self.stack.pop(0)
-                    rand2 = self.stack.pop(0)
-                    self.stack.insert(0, self.apply_binary_operation(rator, rand1, rand2))
+                    rand1 = self.stack.popleft()
+                    rand2 = self.stack.popleft()
+                    self.stack.appendleft(self.apply_binary_operation(rator, rand1, rand2))
             elif isinstance(current_symbol, Beta):
                 # Handle Beta expression
                 if (self.stack[0].get_data() == "true"):
                     self.control.pop()
                 else:
                     self.control.pop(-2)
-                self.stack.pop(0)
+                self.stack.popleft()
             elif isinstance(current_symbol, Tau):
                 # Handle Tau expression
                 tau = current_symbol
                 tup = Tup()
                 for _ in range(tau.get_n()):
-                    tup.symbols.append(self.stack.pop(0))
-                self.stack.insert(0, tup)
+                    tup.symbols.append(self.stack.popleft())
+                self.stack.appendleft(tup)
             elif isinstance(current_symbol, Delta):
                 # Handle Delta expression
                 self.control.extend(current_symbol.symbols)
@@ -495,7 +496,7 @@ class CSEMachine:
                 # Handle B expression
                 self.control.extend(current_symbol.symbols)
             else:
-                self.stack.insert(0, current_symbol)
+                self.stack.appendleft(current_symbol)
 
     def convert_string_to_bool(self, data):
         """
@@ -507,10 +508,7 @@ class CSEMachine:
         Returns:
             bool: The converted boolean
         """
-        if data == "true":
-            return True
-        elif data == "false":
-            return False
+        return convert_string_to_bool(data)  # Shared table lookup in utils.helper_functions
 
     def apply_unary_operation(self, rator, rand):
         """
@@ -778,9 +776,9 @@ class CSEMachineFactory:
             ast: The AST
             
         Returns:
-            list: The stack
+            deque: The stack, with its top at the left end
         """
-        return [self.e0]
+        return deque([self.e0])
 
     def get_environment(self):
         """
@@ -20,5 +20,6 @@ if __name__ == "__main__":
     
     tokens = tokenize(code)
     
-    for token in tokens:
-        print(f"{token.type.name}: {token.value}")
+    # Collect all lines and write them at once instead of printing per token
+    lines = [f"{token.type.name}: {token.value}" for token in tokens]
+    sys.stdout.write("".join(line + "\n" for line in lines))
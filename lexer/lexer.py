@@ -8,8 +8,43 @@ identifiers, numbers, operators, punctuation, etc.
 """
 
 import re   # Regular expressions for pattern matching
+import sys  # sys.intern for sharing repeated identifier names
 from utils.token_types import TokenType, Token # TokenType enum and Token dataclass are defined externally
 
+# Keywords and punctuation are fully determined by their text and tokens are never
+# modified after lexing, so one shared Token per distinct lexeme is reused everywhere.
+_SHARED_TOKENS = {}
+
+# Reserved keywords of the RPAL language. They match the identifier pattern and are
+# re-tagged with one set lookup instead of a separate regex alternative per keyword.
+_KEYWORDS = frozenset({'let', 'in', 'fn', 'where', 'aug', 'or', 'not', 'gr', 'ge', 'ls', 'le',
+                       'eq', 'ne', 'true', 'false', 'nil', 'dummy', 'within', 'and', 'rec'})
+
+# Dictionary mapping token types to their regex patterns, most frequent kinds first.
+# COMMENT and STRING must stay ahead of OPERATOR, whose character class also covers
+# the '/' and quote characters they start with.
+_TOKEN_PATTERNS = {
+    'SPACES': r'[ \t\n]+', # Whitespace characters: spaces, tabs, and newlines (ignored by the lexer)
+    'IDENTIFIER': r'[a-zA-Z][a-zA-Z0-9_]*', # Identifiers and keywords: must start with a letter and can include letters, digits, and underscores
+    'PUNCTUATION': r'[();,]', # Punctuation characters: parentheses, semicolons, commas
+    'INTEGER': r'\d+', # Integers: sequences of digits
+    'COMMENT': r'//.*', # Line comments start with // and go until the end of the line
+    'STRING': r'\'(?:\\\'|[^\'])*\'', # String literals enclosed in single quotes, can contain escaped quotes (e.g., \')
+    'OPERATOR': r'[+\-*<>&.@/:=~|$\#!%^_\[\]{}"\'?]+'
+}
+
+# Combine all patterns into one alternation of named groups, compiled once at import.
+# Alternatives are tried in the order above, so the first pattern that matches at a
+# position still wins.
+_TOKEN_REGEX = re.compile('|'.join(f'(?P<{key}>{pattern})' for key, pattern in _TOKEN_PATTERNS.items()))
+
+# Patterns whose matches are skipped rather than turned into tokens
+_SKIP_KINDS = frozenset({'SPACES', 'COMMENT'})
+
+# Token type for each pattern that produces tokens, resolved once instead of per match
+_TOKEN_TYPE_FOR = {key: getattr(TokenType, key) for key in _TOKEN_PATTERNS if key not in _SKIP_KINDS}
+_TOKEN_TYPE_FOR['KEYWORD'] = TokenType.KEYWORD  # Assigned to identifiers found in _KEYWORDS
+
 def tokenize(input_str):
     """
     Tokenize the input string according to RPAL lexical rules.
@@ -21,35 +56,32 @@ def tokenize(input_str):
         list: A list of Token objects
     """
     tokens = []  # This will store all the tokens we extract from the input string
+    position = 0  # Position in the input where the next token is expected to start
 
-    # Dictionary mapping token types to their regex patterns
-    token_patterns = {
-        'COMMENT': r'//.*',   # Line comments start with // and go until the end of the line
-        'KEYWORD': r'(let|in|fn|where|aug|or|not|gr|ge|ls|le|eq|ne|true|false|nil|dummy|within|and|rec)\b',   # Reserved keywords of the RPAL language
-        'STRING': r'\'(?:\\\'|[^\'])*\'', # String literals enclosed in single quotes, can contain escaped quotes (e.g., \')
-        'IDENTIFIER': r'[a-zA-Z][a-zA-Z0-9_]*',  # Identifiers: must start with a letter and can include letters, digits, and underscores
-        'INTEGER': r'\d+', # Integers: sequences of digits
-        'OPERATOR': r'[+\-*<>&.@/:=~|$\#!%^_\[\]{}"\'?]+', 
-        'SPACES': r'[ \t\n]+',  # Whitespace characters: spaces, tabs, and newlines (ignored by the lexer)
-        'PUNCTUATION': r'[();,]'  # Punctuation characters: parentheses, semicolons, commas
-    }
-    
-    # Process the input string until it's empty
-    while input_str:
-        matched = False  # Flag to track whether a valid token was matched in this iteration
-
-         # Try each token pattern in the order they appear
-        for key, pattern in token_patterns.items():
-            match = re.match(pattern, input_str)  # Match the pattern at the beginning of the string
-            if match:
-                if key != 'SPACES' and key != 'COMMENT':   # Skip adding whitespace and comments to the token list
-                    token_type = getattr(TokenType, key)  # Get the corresponding token type from the TokenType enum
-                    tokens.append(Token(token_type, match.group(0))) # Create a new Token and add it to the list
-                input_str = input_str[match.end():]  # Remove the matched portion from the input string
-                matched = True # Mark that a token was successfully matched
-                break # Exit the loop and restart the outer loop with updated input
-        
-        if not matched:   # If no pattern matched the current beginning of the input string, raise an error
-            raise ValueError(f"Unable to tokenize: '{input_str[:20]}...'")
+    # Scan the whole input in a single pass without slicing off the consumed prefix
+    for match in _TOKEN_REGEX.finditer(input_str):
+        if match.start() != position:  # Skipped over text that no pattern matched
+            raise ValueError(f"Unable to tokenize: '{input_str[position:position + 20]}...'")
+        position = match.end()  # Continue right after the matched text
+        key = match.lastgroup  # Name of the pattern that matched
+        if key in _SKIP_KINDS:   # Skip adding whitespace and comments to the token list
+            continue
+        value = match.group(0)
+        if key == 'IDENTIFIER':
+            if value in _KEYWORDS:
+                key = 'KEYWORD'  # Reserved word matched by the identifier pattern
+            else:
+                value = sys.intern(value)  # Repeated names share a single string object
+        if key == 'KEYWORD' or key == 'PUNCTUATION':
+            token = _SHARED_TOKENS.get(value)  # Reuse the shared token for this keyword or punctuation mark
+            if token is None:
+                token = _SHARED_TOKENS[value] = Token(_TOKEN_TYPE_FOR[key], value)
+        else:
+            token_type = _TOKEN_TYPE_FOR[key]  # Get the corresponding token type from the TokenType enum
+            token = Token(token_type, value) # Create a new Token
+        tokens.append(token) # Add the token to the list
+
+    if position != len(input_str):   # Trailing text that no pattern matched
+        raise ValueError(f"Unable to tokenize: '{input_str[position:position + 20]}...'")
     
     return tokens # Return the complete list of Token objects
\ No newline at end of file
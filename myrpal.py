@@ -13,6 +13,10 @@ from parser.parser import Parser
 from ast.ast_printer import ASTFactory
 from cse_machine.cse_machine import CSEMachineFactory
 
+# The parser and CSE machine recurse once per level of nesting, and one
+# level of RPAL nesting costs about fifteen parser frames, so raise the default limit
+sys.setrecursionlimit(10000)
+
 def main():
     """Main entry point for the RPAL interpreter."""
     parser = argparse.ArgumentParser(description='RPAL Language Interpreter')
@@ -23,8 +27,8 @@ def main():
     args = parser.parse_args()
 
     try:
-        # Read input file
-        with open(args.file_name, "r") as input_file:
+        # Read input file (text mode normalizes \r\n and \r line endings to \n)
+        with open(args.file_name, "r", encoding="utf-8") as input_file:
             input_text = input_file.read()
         
         # Tokenize the input text
@@ -36,18 +40,15 @@ def main():
         if ast_nodes is None:
             sys.exit(1)
         
-        # Convert to string representation
-        string_ast = parser.convert_ast_to_string_ast()
-        
-        # If -ast flag is provided, print the AST and exit
+        # If -ast flag is provided, print the AST in its string form and exit
         if args.ast:
-            for string in string_ast:
-                print(string)
+            string_ast = parser.convert_ast_to_string_ast()
+            sys.stdout.write("".join(string + "\n" for string in string_ast))  # One write for the whole tree
             return
         
-        # Create and standardize the AST
+        # Build the AST straight from the parsed nodes and standardize it
         ast_factory = ASTFactory()
-        ast = ast_factory.get_abstract_syntax_tree(string_ast)
+        ast = ast_factory.get_abstract_syntax_tree_from_nodes(ast_nodes)
         ast.standardize()
         
         # If -st flag is provided, print the standardized tree and exit
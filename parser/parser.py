@@ -3,11 +3,12 @@ Parser for RPAL Language
 Parses tokens into an Abstract Syntax Tree (AST).
 """
 
-from enum import Enum
+from enum import IntEnum
+from functools import lru_cache
 from utils.token_types import TokenType, Token # Importing necessary classes for tokenization
 
 
-class NodeType(Enum):
+class NodeType(IntEnum):
     """Enum representing different node types in the AST."""
     # Define all possible node types in the AST as enum values
 
@@ -44,19 +45,96 @@ class NodeType(Enum):
     COMMA = 31  # For comma-separated lists
     EMPTY_PARAMS = 32 # For empty parameter lists
 
+# Upper-case name of each node type, indexed by its integer value, for building leaf labels
+_KIND_NAME = [""] * (max(NodeType) + 1)
+for _node_type in NodeType:
+    _KIND_NAME[_node_type] = _node_type.name.upper()
+_KIND_NAME = tuple(_KIND_NAME)
+del _node_type
+
+# Bitmask of the leaf node types printed as <TYPE:value>, so the check is a single AND
+_LEAF_MASK = ((1 << NodeType.IDENTIFIER) | (1 << NodeType.INTEGER) | (1 << NodeType.STRING) |
+              (1 << NodeType.TRUE) | (1 << NodeType.FALSE) | (1 << NodeType.NIL) | (1 << NodeType.DUMMY))
+
+# End Of Tokens marker appended by parse(); tokens are never modified, so one instance is shared
+EOF_TOKEN = Token(TokenType.END_OF_TOKENS, "")
+
+# Token types that Rn turns directly into a leaf node, and the node type each one becomes
+_RN_TOKEN_NODE_TYPE = {
+    TokenType.IDENTIFIER: NodeType.IDENTIFIER,
+    TokenType.INTEGER: NodeType.INTEGER,
+    TokenType.STRING: NodeType.STRING,
+}
+
+# Keywords that Rn accepts as literal operands, and the node type each one becomes
+_RN_KEYWORD_NODE_TYPE = {
+    "true": NodeType.TRUE,
+    "false": NodeType.FALSE,
+    "nil": NodeType.NIL,
+    "dummy": NodeType.DUMMY,
+}
+
+# Keywords that E parses itself (let and fn); everything else goes through Ew
+_E_KEYWORDS = frozenset({"let", "fn"})
+
+# Token values that can start another operand of R: the literal keywords and "("
+_R_START_VALUES = frozenset(_RN_KEYWORD_NODE_TYPE) | {"("}
+
+# Operators of the left-associative rules, mapped to the (NodeType, value) of the node they build
+_TA_OPERATORS = {"aug": (NodeType.AUG, "aug")}
+_B_OPERATORS = {"or": (NodeType.OR, "or")}
+_BT_OPERATORS = {"&": (NodeType.AND, "&")}
+_A_OPERATORS = {"+": (NodeType.PLUS, "+"), "-": (NodeType.MINUS, "-")}
+_AT_OPERATORS = {"*": (NodeType.MULTIPLY, "*"), "/": (NodeType.DIVIDE, "/")}
+
+# Comparison operators accepted by Bp, mapped to the name used in the tree
+_COMPARISON_OPERATORS = {
+    ">": "gr", ">=": "ge", "<": "ls", "<=": "le",
+    "gr": "gr", "ge": "ge", "ls": "ls", "le": "le", "eq": "eq", "ne": "ne",
+}
+
+@lru_cache(maxsize=8192)
+def _format_leaf(node_type, value):
+    """Build the <TYPE:value> label for a leaf; repeated leaves reuse the cached string."""
+    return f"<{_KIND_NAME[node_type]}:{value}>"
+
 class Node:
     """Class representing a node in the AST."""
+    # Fixed attribute layout: no per-instance __dict__ for the node created per grammar step
+    __slots__ = ("type", "value", "no_of_children")
+
     def __init__(self, node_type, value, children):
         self.type = node_type # Type of the node (from NodeType enum)
         self.value = value  # Value of the node (e.g., variable name, operator symbol)
         self.no_of_children = children # Number of children this node has
 
+    def get_label(self):
+        """
+        Get the text used for this node in the AST (e.g. <IDENTIFIER:x>, gamma).
+        
+        Returns:
+            str: The node label
+        """
+        # Check the type of the node and build its label accordingly
+        if (1 << self.type) & _LEAF_MASK:
+            # If the node is an identifier, integer, string, true, false, nil or dummy, label it with its type and value
+            return _format_leaf(self.type, self.value)
+        elif self.type is NodeType.FUNCTION_FORM:
+            # If the node is a function form, use the function_form label
+            return "function_form"
+        else:
+            # If the node is anything else, label it with its value
+            return self.value
+
 class Parser:
     """Parser for RPAL language."""
     def __init__(self, tokens):
-        self.tokens = tokens # Input tokens to parse
+        self.tokens = tokens # Input tokens to parse (read in place, never consumed)
+        self.pos = 0 # Index of the current token in self.tokens
         self.ast = [] # The abstract syntax tree being built
         self.string_ast = []  # String representation of the AST
+        self.is_parsed = False  # Whether parse() has already run on these tokens
+        self.parse_result = None  # Cached return value of parse()
 
     def parse(self):
         """
@@ -65,16 +143,23 @@ class Parser:
         Returns:
             list: The AST as a list of nodes
         """
-        self.tokens.append(Token(TokenType.END_OF_TOKENS, ""))  # Add an End Of Tokens marker
+        if self.is_parsed:
+            return self.parse_result  # Tokens were already parsed; reuse the result
+
+        # Add an End Of Tokens marker unless the token list already ends with one
+        if not self.tokens or self.tokens[-1].type is not TokenType.END_OF_TOKENS:
+            self.tokens.append(EOF_TOKEN)
         self.E()  # Start parsing from the entry point (E production rule)
-        if self.tokens[0].type == TokenType.END_OF_TOKENS:
-            return self.ast  # Return the completed AST if parsing was successful
+        self.is_parsed = True
+        if self.tokens[self.pos].type is TokenType.END_OF_TOKENS:
+            self.parse_result = self.ast  # Return the completed AST if parsing was successful
         else:
             print("Parsing Unsuccessful!") # Print error message if parsing failed
             print("Remaining unparsed tokens:")
-            for token in self.tokens:
+            for token in self.tokens[self.pos:]:
                 print(token) # Print remaining tokens
-            return None # Return None if parsing failed
+            self.parse_result = None # Return None if parsing failed
+        return self.parse_result
 
     def convert_ast_to_string_ast(self):
         """
@@ -83,35 +168,35 @@ class Parser:
         Returns:
             list: The AST as a list of strings
         """
-        dots = ""   # String to track indentation leve
-        stack = []   # Stack to manage traversal of the AST
-
-        while self.ast: # Process until AST is empty
-            if not stack: # If stack is empty, process next node from AST
-                if self.ast[-1].no_of_children == 0: # If leaf node
-                    self.add_strings(dots, self.ast.pop()) # Add to string representation
-                else: # If non-leaf node
-                    node = self.ast.pop()
-                    stack.append(node) # Push to stack for processing children
-            else: # If stack is not empty
-                if self.ast[-1].no_of_children > 0: # If next node has children
-                    node = self.ast.pop()
-                    stack.append(node) # Push to stack
-                    dots += "."  # Increase indentation level
-                else:
-                    stack.append(self.ast.pop())
-                    dots += "." # Increase indentation level
-                    while stack[-1].no_of_children == 0:
-                        self.add_strings(dots, stack.pop()) # Add to string representation
-                        if not stack: # If stack is empty, we're done
-                            break
-                        dots = dots[:-1] # Decrease indentation level
-                        node = stack.pop()
-                        node.no_of_children -= 1 # Decrease child count of parent
-                        stack.append(node) # Push parent back to stack
-
-        # Reverse the list to get correct ordering
-        self.string_ast.reverse()
+        if self.string_ast:
+            return self.string_ast  # Already converted; reuse the result
+
+        # self.ast is in post-order: a node's children are the last subtrees completed
+        # before it. Record each node's child indices without consuming the list.
+        children = []  # children[i] holds the indices of the children of self.ast[i]
+        roots = []  # Indices of completed subtrees still waiting for a parent
+        for index, node in enumerate(self.ast):
+            count = node.no_of_children
+            if count:
+                children.append(roots[-count:])
+                del roots[-count:]
+            else:
+                children.append(())
+            roots.append(index)
+
+        dots = [""]  # dots[d] is the indentation prefix for depth d, grown on demand
+        stack = [(index, 0) for index in reversed(roots)]  # (node index, depth) pairs to visit
+
+        # Walk the tree in pre-order, emitting lines in their final order
+        while stack:
+            index, depth = stack.pop()
+            while len(dots) <= depth:
+                dots.append(dots[-1] + ".")
+            self.add_strings(dots[depth], self.ast[index])
+            # Push children in reverse so the leftmost child is emitted first
+            for child in reversed(children[index]):
+                stack.append((child, depth + 1))
+
         return self.string_ast
 
     def add_strings(self, dots, node):
@@ -122,49 +207,52 @@ class Parser:
             dots (str): The indentation for the node
             node (Node): The node to add
         """
-        # Check the type of the node and add it to the string AST accordingly
-        if node.type in [NodeType.IDENTIFIER, NodeType.INTEGER, NodeType.STRING, NodeType.TRUE,
-                         NodeType.FALSE, NodeType.NIL, NodeType.DUMMY]:
-            # If the node is an identifier, integer, string, true, false, nil or dummy, add it to the string AST with its type and value
-            self.string_ast.append(dots + "<" + node.type.name.upper() + ":" + node.value + ">")
-        elif node.type == NodeType.FUNCTION_FORM:
-            # If the node is a function form, add it to the string AST with the function_form label
-            self.string_ast.append(dots + "function_form")
-        else:
-            # If the node is anything else, add it to the string AST with its value
-            self.string_ast.append(dots + node.value)
+        self.string_ast.append(dots + node.get_label())
 
     # Grammar rules implementation
+    # Rules that loop bind self.tokens and self.ast to locals. self.pos stays on the
+    # instance, since every sub-rule they call advances it.
     
+    def _left_assoc(self, operand, operators):
+        """
+        Parse the (operator operand)* tail of a left-associative rule whose first
+        operand has already been parsed.
+        
+        Args:
+            operand: The rule method that parses each operand
+            operators (dict): Maps each operator token value to its (NodeType, value) pair
+        """
+        tokens, ast = self.tokens, self.ast
+        entry = operators.get(tokens[self.pos].value)
+        while entry is not None:
+            self.pos += 1  # Skip the operator
+            operand()
+            ast.append(Node(entry[0], entry[1], 2))
+            entry = operators.get(tokens[self.pos].value)
+
     def E(self):
         """Parse an E expression."""
-        if not self.tokens:
-            return
-            
-        token = self.tokens[0]
+        token = self.tokens[self.pos]
         # Check if the token is a keyword and if it is either "let" or "fn"
-        if token.type == TokenType.KEYWORD and token.value in ["let", "fn"]:
+        if token.type is TokenType.KEYWORD and token.value in _E_KEYWORDS:
             # If the token is "let"
             if token.value == "let":
-                self.tokens.pop(0)  # Remove "let"
+                self.pos += 1  # Skip "let"
                 self.D()  # Parse the next expression
                 # Check if the next token is "in"
-                if self.tokens[0].value != "in":
+                if self.tokens[self.pos].value != "in":
                     raise ValueError("Parse error: 'in' expected")
-                self.tokens.pop(0)  # Remove "in"
+                self.pos += 1  # Skip "in"
                 self.E()  # Parse the next expression
                 self.ast.append(Node(NodeType.LET, "let", 2))  # Add a LET node to the AST
             else:  # fn
-                self.tokens.pop(0)  # Remove "fn"
-                n = 0
-                # Parse the next expression until a "." is encountered
-                while self.tokens and (self.tokens[0].type == TokenType.IDENTIFIER or self.tokens[0].value == "("):
-                    self.Vb()
-                    n += 1
+                self.pos += 1  # Skip "fn"
+                # Parse the bound variables up to the "."
+                n = self._parse_vb_plus()
                 # Check if a "." is encountered
-                if not self.tokens or self.tokens[0].value != ".":
+                if self.tokens[self.pos].value != ".":
                     raise ValueError("Parse error: '.' expected")
-                self.tokens.pop(0)  # Remove "."
+                self.pos += 1  # Skip "."
                 self.E()  # Parse the next expression
                 self.ast.append(Node(NodeType.LAMBDA, "lambda", n + 1))  # Add a LAMBDA node to the AST
         else:
@@ -174,64 +262,56 @@ class Parser:
         """Parse an Ew expression."""
         self.T()
         # Check if the next token is "where"
-        if self.tokens[0].value == "where":
-            self.tokens.pop(0)  # Remove "where"
+        if self.tokens[self.pos].value == "where":
+            self.pos += 1  # Skip "where"
             self.Dr()
             self.ast.append(Node(NodeType.WHERE, "where", 2))
 
     def T(self):
         """Parse a T expression."""
+        tokens, ast = self.tokens, self.ast
         self.Ta()
         n = 1
         # Loop through the tokens until a comma is not found
-        while self.tokens[0].value == ",":
-            self.tokens.pop(0)  # Remove comma
+        while tokens[self.pos].value == ",":
+            self.pos += 1  # Skip comma
             self.Ta()
             n += 1
         if n > 1:
-            self.ast.append(Node(NodeType.TAU, "tau", n))
+            ast.append(Node(NodeType.TAU, "tau", n))
 
     def Ta(self):
         """Parse a Ta expression."""
         self.Tc()
-        while self.tokens[0].value == "aug":
-            self.tokens.pop(0)  # Remove "aug"
-            self.Tc()
-            self.ast.append(Node(NodeType.AUG, "aug", 2))
+        self._left_assoc(self.Tc, _TA_OPERATORS)
 
     def Tc(self):
         """Parse a Tc expression."""
         self.B()
-        if self.tokens[0].value == "->":
-            self.tokens.pop(0)  # Remove "->"
+        if self.tokens[self.pos].value == "->":
+            self.pos += 1  # Skip "->"
             self.Tc()
-            if self.tokens[0].value != "|":
+            if self.tokens[self.pos].value != "|":
                 raise ValueError("Parse error: '|' expected")
-            self.tokens.pop(0)  # Remove "|"
+            self.pos += 1  # Skip "|"
             self.Tc()
             self.ast.append(Node(NodeType.CONDITIONAL, "->", 3))
 
     def B(self):
         """Parse a B expression."""
         self.Bt()
-        while self.tokens[0].value == "or":
-            self.tokens.pop(0)  # Remove "or"
-            self.Bt()
-            self.ast.append(Node(NodeType.OR, "or", 2))
+        self._left_assoc(self.Bt, _B_OPERATORS)
 
     def Bt(self):
         """Parse a Bt expression."""
         self.Bs()
-        while self.tokens[0].value == "&":
-            self.tokens.pop(0)  # Remove "&"
-            self.Bs()
-            self.ast.append(Node(NodeType.AND, "&", 2))
+        self._left_assoc(self.Bs, _BT_OPERATORS)
 
     def Bs(self):
         """Parse a Bs expression."""
         # Check if the first token is "not"
-        if self.tokens[0].value == "not":
-            self.tokens.pop(0)  # Remove "not"
+        if self.tokens[self.pos].value == "not":
+            self.pos += 1  # Skip "not"
             self.Bp()
             self.ast.append(Node(NodeType.NOT, "not", 1))
         else:
@@ -241,81 +321,46 @@ class Parser:
         """Parse a Bp expression."""
         # Call the A() method to parse the first part of the expression
         self.A()
-        # Get the current token
-        token = self.tokens[0]
-        # Check if the token value is one of the comparison operators
-        if token.value in [">", ">=", "<", "<=", "gr", "ge", "ls", "le", "eq", "ne"]:
-            # Remove the token from the list
-            self.tokens.pop(0)
+        # Look up the comparison operator; symbolic forms map to their keyword names
+        op_value = _COMPARISON_OPERATORS.get(self.tokens[self.pos].value)
+        if op_value is not None:
+            # Move past the token
+            self.pos += 1
             # Call the A() method to parse the second part of the expression
             self.A()
-            # Store the token value in a variable
-            op_value = token.value
-            # Convert the token value to the appropriate operator
-            if token.value == ">":
-                op_value = "gr"
-            elif token.value == ">=":
-                op_value = "ge"
-            elif token.value == "<":
-                op_value = "ls"
-            elif token.value == "<=":
-                op_value = "le"
             # Create a new Node object with the comparison operator and append it to the ast list
             self.ast.append(Node(NodeType.COMPARE, op_value, 2))
 
     def A(self):
         """Parse an A expression."""
         # Check if the first token is a unary plus or minus
-        if self.tokens[0].value == "+":
-            self.tokens.pop(0)  # Remove unary plus
+        if self.tokens[self.pos].value == "+":
+            self.pos += 1  # Skip unary plus
             self.At()
-        elif self.tokens[0].value == "-":
-            self.tokens.pop(0)  # Remove unary minus
+        elif self.tokens[self.pos].value == "-":
+            self.pos += 1  # Skip unary minus
             self.At()
             self.ast.append(Node(NodeType.NEG, "neg", 1))  # Append a negation node to the AST
         else:
             self.At()
 
-        # Loop through the tokens and check if they are addition or subtraction operators
-        while self.tokens[0].value in ["+", "-"]:
-            current_token = self.tokens[0]
-            self.tokens.pop(0)
-            self.At()
-            # Append the appropriate node to the AST based on the operator
-            if current_token.value == "+":
-                self.ast.append(Node(NodeType.PLUS, "+", 2))
-            else:
-                self.ast.append(Node(NodeType.MINUS, "-", 2))
+        # Parse any following additions or subtractions
+        self._left_assoc(self.At, _A_OPERATORS)
 
     def At(self):
         """Parse an At expression."""
-        # Parse the first factor
+        # Parse the first factor, then any following multiplications or divisions
         self.Af()
-        # While the current token is a multiplication or division operator
-        while self.tokens[0].value in ["*", "/"]:
-            # Store the current token
-            current_token = self.tokens[0]
-            # Remove the current token from the token list
-            self.tokens.pop(0)
-            # Parse the next factor
-            self.Af()
-            # If the current token is a multiplication operator
-            if current_token.value == "*":
-                # Append a multiply node to the abstract syntax tree
-                self.ast.append(Node(NodeType.MULTIPLY, "*", 2))
-            # Else if the current token is a division operator
-            else:
-                # Append a divide node to the abstract syntax tree
-                self.ast.append(Node(NodeType.DIVIDE, "/", 2))
+        self._left_assoc(self.Af, _AT_OPERATORS)
 
     def Af(self):
         """Parse an Af expression."""
         # Parse an Ap expression
         self.Ap()
         # Check if the current token is "**"
-        if self.tokens[0].value == "**":
-            # Remove the "**" token from the list
-            self.tokens.pop(0)
+        if self.tokens[self.pos].value == "**":
+            # Move past the "**" token
+            self.pos += 1
             # Parse an Af expression
             self.Af()
             # Append a Node to the ast list with the type POWER, value "**", and 2 children
@@ -323,83 +368,68 @@ class Parser:
 
     def Ap(self):
         """Parse an Ap expression."""
+        tokens, ast = self.tokens, self.ast
         # Parse the R expression
         self.R()
         # While the current token is an '@' symbol
-        while self.tokens[0].value == "@":
-            # Remove the '@' symbol from the token list
-            self.tokens.pop(0)
+        while tokens[self.pos].value == "@":
+            # Move past the '@' symbol
+            self.pos += 1
             
             # If the next token is not an identifier, raise a ValueError
-            if self.tokens[0].type != TokenType.IDENTIFIER:
+            if tokens[self.pos].type is not TokenType.IDENTIFIER:
                 raise ValueError("Parse error: identifier expected")
             
             # Append a Node to the AST with the identifier value
-            self.ast.append(Node(NodeType.IDENTIFIER, self.tokens[0].value, 0))
-            # Remove the identifier from the token list
-            self.tokens.pop(0)
+            ast.append(Node(NodeType.IDENTIFIER, tokens[self.pos].value, 0))
+            # Move past the identifier
+            self.pos += 1
             
             # Parse the R expression
             self.R()
             # Append a Node to the AST with the '@' symbol
-            self.ast.append(Node(NodeType.AT, "@", 3))
+            ast.append(Node(NodeType.AT, "@", 3))
 
     def R(self):
         """Parse an R expression."""
+        tokens, ast = self.tokens, self.ast
         # Parse an R expression by calling the Rn() method
         self.Rn()
+        token = tokens[self.pos]
         # While the first token is an identifier, integer, string, true, false, nil, dummy, or an opening parenthesis
-        while (self.tokens[0].type in [TokenType.IDENTIFIER, TokenType.INTEGER, TokenType.STRING] or
-               self.tokens[0].value in ["true", "false", "nil", "dummy"] or
-               self.tokens[0].value == "("):
-            
+        while token.type in _RN_TOKEN_NODE_TYPE or token.value in _R_START_VALUES:
             # Parse another R expression by calling the Rn() method
             self.Rn()
             # Append a new node to the AST with the type GAMMA and the value "gamma" and 2 children
-            self.ast.append(Node(NodeType.GAMMA, "gamma", 2))
+            ast.append(Node(NodeType.GAMMA, "gamma", 2))
+            token = tokens[self.pos]
 
     def Rn(self):
         """Parse an Rn expression."""
         # Get the type and value of the first token in the tokens list
-        token_type = self.tokens[0].type
-        token_value = self.tokens[0].value
+        token_type = self.tokens[self.pos].type
+        token_value = self.tokens[self.pos].value
         
-        # If the token is an identifier, create a Node with the identifier type and value, and append it to the ast list
-        if token_type == TokenType.IDENTIFIER:
-            self.ast.append(Node(NodeType.IDENTIFIER, token_value, 0))
-            self.tokens.pop(0)
-        # If the token is an integer, create a Node with the integer type and value, and append it to the ast list
-        elif token_type == TokenType.INTEGER:
-            self.ast.append(Node(NodeType.INTEGER, token_value, 0))
-            self.tokens.pop(0)
-        # If the token is a string, create a Node with the string type and value, and append it to the ast list
-        elif token_type == TokenType.STRING:
-            self.ast.append(Node(NodeType.STRING, token_value, 0))
-            self.tokens.pop(0)
-        # If the token is a keyword, check the value and create a Node with the corresponding type and value, and append it to the ast list
-        elif token_type == TokenType.KEYWORD:
-            if token_value == "true":
-                self.ast.append(Node(NodeType.TRUE, token_value, 0))
-                self.tokens.pop(0)
-            elif token_value == "false":
-                self.ast.append(Node(NodeType.FALSE, token_value, 0))
-                self.tokens.pop(0)
-            elif token_value == "nil":
-                self.ast.append(Node(NodeType.NIL, token_value, 0))
-                self.tokens.pop(0)
-            elif token_value == "dummy":
-                self.ast.append(Node(NodeType.DUMMY, token_value, 0))
-                self.tokens.pop(0)
-            else:
+        # Identifiers, integers and strings map straight to a leaf node type
+        node_type = _RN_TOKEN_NODE_TYPE.get(token_type)
+        if node_type is not None:
+            self.ast.append(Node(node_type, token_value, 0))
+            self.pos += 1
+        # If the token is a keyword, look up the literal it stands for (true, false, nil or dummy)
+        elif token_type is TokenType.KEYWORD:
+            node_type = _RN_KEYWORD_NODE_TYPE.get(token_value)
+            if node_type is None:
                 raise ValueError(f"Parse error: unexpected keyword '{token_value}'")
+            self.ast.append(Node(node_type, token_value, 0))
+            self.pos += 1
         # If the token is punctuation, check the value and create a Node with the corresponding type and value, and append it to the ast list
-        elif token_type == TokenType.PUNCTUATION:
+        elif token_type is TokenType.PUNCTUATION:
             if token_value == "(":
-                self.tokens.pop(0)
+                self.pos += 1
                 self.E()
-                if self.tokens[0].value != ")":
+                if self.tokens[self.pos].value != ")":
                     raise ValueError("Parse error: ')' expected")
-                self.tokens.pop(0)
+                self.pos += 1
             else:
                 raise ValueError(f"Parse error: unexpected punctuation '{token_value}'")
         else:
@@ -410,9 +440,9 @@ class Parser:
         # Parse a Da expression
         self.Da()
         # Check if the next token is "within"
-        if self.tokens[0].value == "within":
-            # Remove the "within" token from the list
-            self.tokens.pop(0)
+        if self.tokens[self.pos].value == "within":
+            # Move past the "within" token
+            self.pos += 1
             # Parse a D expression
             self.D()
             # Append a Node to the AST with the type "within" and the value "within" and the number of children as 2
@@ -420,30 +450,31 @@ class Parser:
 
     def Da(self):
         """Parse a Da expression."""
+        tokens, ast = self.tokens, self.ast
         # Parse a Dr expression
         self.Dr()
         # Initialize a counter for the number of "and" tokens
         n = 1
         # While the first token is "and"
-        while self.tokens[0].value == "and":
-            # Remove the "and" token from the list
-            self.tokens.pop(0)
+        while tokens[self.pos].value == "and":
+            # Move past the "and" token
+            self.pos += 1
             # Parse a Dr expression
             self.Dr()
             # Increment the counter
             n += 1
         # If the counter is greater than 1, add an AND_OP node to the AST
         if n > 1:
-            self.ast.append(Node(NodeType.AND_OP, "and", n))
+            ast.append(Node(NodeType.AND_OP, "and", n))
 
     def Dr(self):
         """Parse a Dr expression."""
         # Initialize a variable to check if the expression is recursive
         is_rec = False
         # Check if the first token is "rec"
-        if self.tokens[0].value == "rec":
-            # Remove the "rec" token from the list
-            self.tokens.pop(0)
+        if self.tokens[self.pos].value == "rec":
+            # Move past the "rec" token
+            self.pos += 1
             # Set the is_rec variable to True
             is_rec = True
         # Call the Db method to parse the Db expression
@@ -455,63 +486,59 @@ class Parser:
     def Db(self):
         """Parse a Db expression."""
         # Check if the first token is a punctuation and if it is an opening parenthesis
-        if self.tokens[0].type == TokenType.PUNCTUATION and self.tokens[0].value == "(":
-            # Remove the opening parenthesis from the token list
-            self.tokens.pop(0)
+        if self.tokens[self.pos].type is TokenType.PUNCTUATION and self.tokens[self.pos].value == "(":
+            # Move past the opening parenthesis
+            self.pos += 1
             # Parse the D expression
             self.D()
             # Check if the next token is a closing parenthesis
-            if self.tokens[0].value != ")":
+            if self.tokens[self.pos].value != ")":
                 raise ValueError("Parse error: ')' expected")
-            # Remove the closing parenthesis from the token list
-            self.tokens.pop(0)
+            # Move past the closing parenthesis
+            self.pos += 1
         # Check if the first token is an identifier
-        elif self.tokens[0].type == TokenType.IDENTIFIER:
+        elif self.tokens[self.pos].type is TokenType.IDENTIFIER:
             # Check if the next token is an opening parenthesis or an identifier
-            if len(self.tokens) > 1 and (self.tokens[1].value == "(" or self.tokens[1].type == TokenType.IDENTIFIER):
+            if self.tokens[self.pos + 1].value == "(" or self.tokens[self.pos + 1].type is TokenType.IDENTIFIER:
                 # Function form
                 # Add a new node to the abstract syntax tree with the identifier as the value
-                self.ast.append(Node(NodeType.IDENTIFIER, self.tokens[0].value, 0))
-                # Remove the identifier from the token list
-                self.tokens.pop(0)
-
-                n = 1  # Identifier child
-                # While the next token is an identifier or an opening parenthesis
-                while self.tokens[0].type == TokenType.IDENTIFIER or self.tokens[0].value == "(":
-                    # Parse the Vb expression
-                    self.Vb()
-                    n += 1
+                self.ast.append(Node(NodeType.IDENTIFIER, self.tokens[self.pos].value, 0))
+                # Move past the identifier
+                self.pos += 1
+
+                # Identifier child plus one child per parameter
+                n = 1 + self._parse_vb_plus()
                 # Check if the next token is an equal sign
-                if self.tokens[0].value != "=":
+                if self.tokens[self.pos].value != "=":
                     raise ValueError("Parse error: '=' expected")
-                # Remove the equal sign from the token list
-                self.tokens.pop(0)
+                # Move past the equal sign
+                self.pos += 1
                 # Parse the E expression
                 self.E()
 
                 # Add a new node to the abstract syntax tree with the function form as the value
                 self.ast.append(Node(NodeType.FUNCTION_FORM, "function_form", n+1))
             # Check if the next token is an equal sign
-            elif len(self.tokens) > 1 and self.tokens[1].value == "=":
+            elif self.tokens[self.pos + 1].value == "=":
                 # Add a new node to the abstract syntax tree with the identifier as the value
-                self.ast.append(Node(NodeType.IDENTIFIER, self.tokens[0].value, 0))
-                # Remove the identifier from the token list
-                self.tokens.pop(0)
-                # Remove the equal sign from the token list
-                self.tokens.pop(0)  # Remove equal
+                self.ast.append(Node(NodeType.IDENTIFIER, self.tokens[self.pos].value, 0))
+                # Move past the identifier
+                self.pos += 1
+                # Move past the equal sign
+                self.pos += 1  # Skip equal
                 # Parse the E expression
                 self.E()
                 # Add a new node to the abstract syntax tree with the equal sign as the value
                 self.ast.append(Node(NodeType.EQUAL, "=", 2))
             # Check if the next token is a comma
-            elif len(self.tokens) > 1 and self.tokens[1].value == ",":
+            elif self.tokens[self.pos + 1].value == ",":
                 # Parse the Vl expression
                 self.Vl()
                 # Check if the next token is an equal sign
-                if self.tokens[0].value != "=":
+                if self.tokens[self.pos].value != "=":
                     raise ValueError("Parse error: '=' expected")
-                # Remove the equal sign from the token list
-                self.tokens.pop(0)
+                # Move past the equal sign
+                self.pos += 1
                 # Parse the E expression
                 self.E()
                 # Add a new node to the abstract syntax tree with the equal sign as the value
@@ -521,53 +548,74 @@ class Parser:
         else:
             raise ValueError("Parse error: unexpected token")
 
+    def _parse_vb_plus(self):
+        """
+        Parse consecutive Vb expressions, as in the parameters of fn and function forms.
+        
+        Returns:
+            int: The number of Vb expressions parsed
+        """
+        tokens = self.tokens
+        n = 0
+        token = tokens[self.pos]
+        # Each Vb starts with an identifier or an opening parenthesis
+        while token.type is TokenType.IDENTIFIER or token.value == "(":
+            self.Vb()
+            n += 1
+            token = tokens[self.pos]
+        return n
+
     def Vb(self):
         """Parse a Vb expression."""
         # Check if the first token is a punctuation and if it is an opening parenthesis
-        if self.tokens[0].type == TokenType.PUNCTUATION and self.tokens[0].value == "(":
-            # Remove the opening parenthesis from the token list
-            self.tokens.pop(0)
+        if self.tokens[self.pos].type is TokenType.PUNCTUATION and self.tokens[self.pos].value == "(":
+            # Move past the opening parenthesis
+            self.pos += 1
             isVl = False
 
             # Check if the next token is an identifier
-            if self.tokens[0].type == TokenType.IDENTIFIER:
+            if self.tokens[self.pos].type is TokenType.IDENTIFIER:
                 # Parse the Vl expression
                 self.Vl()
                 isVl = True
             
             # Check if the next token is a closing parenthesis
-            if self.tokens[0].value != ")":
+            if self.tokens[self.pos].value != ")":
                 # Raise an error if it is not
                 raise ValueError("Parse error: ')' expected")
-            # Remove the closing parenthesis from the token list
-            self.tokens.pop(0)
+            # Move past the closing parenthesis
+            self.pos += 1
             # If the Vl expression was not parsed, append an empty parameters node to the AST
             if not isVl:
                 self.ast.append(Node(NodeType.EMPTY_PARAMS, "()", 0))
         # Check if the first token is an identifier
-        elif self.tokens[0].type == TokenType.IDENTIFIER:
+        elif self.tokens[self.pos].type is TokenType.IDENTIFIER:
             # Append an identifier node to the AST
-            self.ast.append(Node(NodeType.IDENTIFIER, self.tokens[0].value, 0))
-            # Remove the identifier from the token list
-            self.tokens.pop(0)
+            self.ast.append(Node(NodeType.IDENTIFIER, self.tokens[self.pos].value, 0))
+            # Move past the identifier
+            self.pos += 1
         # Raise an error if the first token is neither an identifier nor an opening parenthesis
         else:
             raise ValueError("Parse error: identifier or '(' expected")
 
     def Vl(self):
         """Parse a Vl expression."""
+        tokens, ast = self.tokens, self.ast
+        pos = self.pos  # Vl calls no other rule, so the cursor can live in a local
         n = 0
         while True:
             if n > 0:
-                self.tokens.pop(0)  # Remove comma
-            if self.tokens[0].type != TokenType.IDENTIFIER:
+                pos += 1  # Skip comma
+            if tokens[pos].type is not TokenType.IDENTIFIER:
+                self.pos = pos
                 raise ValueError("Parse error: identifier expected")
-            self.ast.append(Node(NodeType.IDENTIFIER, self.tokens[0].value, 0))
+            ast.append(Node(NodeType.IDENTIFIER, tokens[pos].value, 0))
             
-            self.tokens.pop(0)
+            pos += 1
             n += 1
-            if self.tokens[0].value != ",":
+            if tokens[pos].value != ",":
                 break
+        self.pos = pos
         
         if n > 1:
-            self.ast.append(Node(NodeType.COMMA, ",", n))
\ No newline at end of file
+            ast.append(Node(NodeType.COMMA, ",", n))
\ No newline at end of file
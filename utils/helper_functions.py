@@ -3,6 +3,8 @@ Helper functions for RPAL Language
 General-purpose utility functions used across the project.
 """
 
+_BOOL_MAP = {"true": True, "false": False}  # RPAL truth value spellings
+
 def convert_string_to_bool(data):
     """
     Convert a string to a boolean.
@@ -13,8 +15,4 @@ def convert_string_to_bool(data):
     Returns:
         bool: The converted boolean
     """
-    if data == "true":
-        return True
-    elif data == "false":
-        return False
-    return None
\ No newline at end of file
+    return _BOOL_MAP.get(data)  # None for anything that isn't a truth value
\ No newline at end of file
@@ -17,6 +17,8 @@ class TokenType(Enum):
 
 class Token:
     """Class representing a token in RPAL."""
+    __slots__ = ("type", "value")  # Tokens are created per lexeme, so skip the per-instance __dict__
+
     def __init__(self, token_type, value):
         if not isinstance(token_type, TokenType):
             raise ValueError("token_type must be an instance of TokenType enum")